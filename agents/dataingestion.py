@@ -1,45 +1,116 @@
-from google.adk.agents import ParallelAgent
-from google.adk.agents import LlmAgent
-
-from expertanalyst import ExpertAnalystAgent
-from newsanalyst import NewsCollectorAgent
-
-INSTRUCTIONS = """
-**Persona:**
-You are a "Merger" agent, a specialized text processor. Your sole function is to take multiple, separate blocks of text from different intelligence sources and consolidate them into a single, clean, and well-structured document. You do not analyze, interpret, or summarize; you only merge and format.
-
-**Objective:**
-Your goal is to receive the direct output from the `DataIngestionAgent`. This output will be a list containing the results from various sub-agents (like the News Collector and Expert Analyst). You must merge the content from all these sources into one unified text block.
-
-**Step-by-Step Instructions:**
-
-1.  **Receive Parallel Outputs:** You will be given the output from the `DataIngestionAgent`. This will be a list of text strings or structured objects.
-2.  **Iterate and Format:** Go through each item in the list. For each item, format it clearly by identifying its source. For example, use headers like `--- START NEWS ANALYSIS ---` or `--- START EXPERT OPINION ANALYSIS ---`.
-3.  **Combine:** Concatenate all the formatted blocks of text into a single, large string.
-4.  **Final Output:** Your final response MUST be only this single, consolidated text block.
-
-**Constraints:**
-- Do not lose any information. All text from all sub-agent outputs must be included in the final merged text.
-- Do not add your own analysis, opinions, or summaries. Your job is strictly to merge.
-- Use clear markdown headers to separate the content from each source agent.
-"""
-
-DataIngestionAgent = ParallelAgent(
-    name = "DataIngestion",
-    model = "gemini-1.5-flash",
-    description = "Takes data from the observed events in the ticker and collects news articles related to the event.",
-    agents = [
-        ExpertAnalystAgent,
-        NewsCollectorAgent,
-    ]
-)
-
-MergerAgent = LlmAgent(
-    name = "Merger",
-    model = "gemini-1.5-flash",
-    description = "Takes data from the observed events in the ticker and collects news articles related to the event.",
-    instruction = "INSTRUCTIONS",
-    agents = [
-        DataIngestionAgent,
-    ]
-)
\ No newline at end of file
+import asyncio
+
+from google.adk.runners import InMemoryRunner
+from google.genai import types
+
+from agents.expertanalyst import ExpertAnalystAgent
+from agents.newsanalyst import NewsCollectorAgent
+from tools import expertanalysttools, newsanalysttools, prefetch, semanticcache
+from tools.expertanalysttools import search_expert_sources
+from tools.keyword import extract_keywords
+from tools.newsanalysttools import get_news_articles
+
+# Per-analyst deadline. With the analysts gathered in parallel, total
+# latency is the max of the two tails; capping each run keeps one slow
+# scrape or model call from stalling the whole market.
+ANALYST_TIMEOUT_SECONDS = 120
+
+
+def reset_tool_caches() -> None:
+    """Clears the tool memoization between markets.
+
+    Within one market both analysts call extract_keywords on the same topic
+    and may repeat overlapping searches, so the lru_cache on each tool
+    deduplicates those calls. Across markets the inputs change, so the
+    caches are flushed at the start of every ingest() to keep them
+    request-scoped."""
+
+    # Drain the prefetcher first: futures that are already running finish
+    # and write into the lru_caches, so the cache wipes below must come
+    # after the drain or a stale entry could land behind them.
+    prefetch.clear()
+
+    extract_keywords.cache_clear()
+    search_expert_sources.cache_clear()
+    get_news_articles.cache_clear()
+    expertanalysttools._load_selected_market.cache_clear()
+    newsanalysttools._load_selected_market.cache_clear()
+
+
+async def _run_analyst(agent, query: str) -> str:
+    """Runs one analyst to completion through an ADK runner.
+
+    BaseAgent.run_async is an event generator that needs an invocation
+    context, not a plain coroutine, so the agent is driven via
+    InMemoryRunner with a throwaway session and the text of its final
+    response event is returned."""
+
+    runner = InMemoryRunner(agent=agent, app_name="oracle")
+    session = await runner.session_service.create_session(
+        app_name="oracle", user_id="ingest"
+    )
+
+    message = types.Content(role="user", parts=[types.Part(text=query)])
+
+    final_text = ""
+    async for event in runner.run_async(
+        user_id="ingest", session_id=session.id, new_message=message
+    ):
+        if event.is_final_response() and event.content and event.content.parts:
+            final_text = "".join(part.text or "" for part in event.content.parts)
+
+    return final_text
+
+
+async def _run_with_deadline(agent, query: str) -> str:
+    """Runs one analyst under the deadline; a timeout yields a marker instead
+    of sinking the other analyst's result."""
+
+    try:
+        return await asyncio.wait_for(_run_analyst(agent, query), ANALYST_TIMEOUT_SECONDS)
+    except asyncio.TimeoutError:
+        print(f"Analyst '{agent.name}' timed out after {ANALYST_TIMEOUT_SECONDS}s.")
+        return f"[{agent.name} timed out after {ANALYST_TIMEOUT_SECONDS}s; no analysis available]"
+
+
+def merge(outputs: dict[str, str]) -> str:
+    """Concatenates the analyst outputs under clear markdown-style headers.
+
+    The old Merger agent was a gemini-1.5-flash call whose own instructions
+    forbade it from doing anything but pasting text together, so the LLM
+    roundtrip bought nothing. A plain join does the same job in microseconds
+    and costs zero tokens.
+    """
+
+    return "\n".join(
+        f"--- START {source.upper()} ---\n{text}\n--- END {source.upper()} ---"
+        for source, text in outputs.items()
+    )
+
+
+async def ingest(query: str) -> str:
+    """Dispatches both analysts concurrently, then merges their outputs.
+
+    The analysts are independent, so running them with asyncio.gather costs
+    max(expert, news) latency instead of their sum.
+    """
+
+    cached = semanticcache.lookup(query)
+    if cached is not None:
+        print(f"Semantic cache hit for: '{query}'")
+        return cached
+
+    reset_tool_caches()
+
+    expert_output, news_output = await asyncio.gather(
+        _run_with_deadline(ExpertAnalystAgent, query),
+        _run_with_deadline(NewsCollectorAgent, query),
+    )
+
+    merged = merge({
+        "expert opinion analysis": str(expert_output),
+        "news analysis": str(news_output),
+    })
+
+    semanticcache.store(query, merged)
+    return merged
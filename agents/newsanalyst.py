@@ -2,8 +2,8 @@ from google.adk.agents import LlmAgent
 from google.adk.tools import FunctionTool
 from pydantic import BaseModel 
 
+from agents.toolregistry import keywordTool
 from tools.newsanalysttools import get_news_articles, scrape_and_assess_news_impact
-from tools.keyword import extract_keywords
 
 class NewsOutput(BaseModel):
     source: str
@@ -12,54 +12,43 @@ class NewsOutput(BaseModel):
     published_at: str
     scraped_content: str
 
+# Must stay a static constant with no per-market interpolation: Gemini's
+# implicit prefix caching only kicks in when the leading instruction tokens
+# are byte-identical across requests. Anything market-specific belongs in
+# the user turn, after this prefix.
 NEWS_ANALYST_INSTRUCTIONS = """
-**Persona:**
-You are a fast and efficient News Collector for a quantitative analysis firm. Your role is to systematically retrieve and document recent news articles relevant to a specific market event. You are meticulous, unbiased, and focused on data gathering, not interpretation.
-
-**Objective:**
-Given a market topic, your mission is to find relevant news articles and process them one by one, extracting the core text and metadata, and formatting this information perfectly into the `NewsOutput` schema.
-
-**Core Workflow (Strictly follow this order):**
-1.  **Extract Keywords:** When given a market topic, your first action is to use the `extract_keywords` tool to identify the essential search terms.
-2.  **Fetch News Articles:** Use the `get_news_articles` tool with the extracted keywords to retrieve a list of recent, relevant news article URLs.
-3.  **Process a Single URL:** From the list of URLs you retrieved, select the most relevant one to process.
-    - **A) Scrape Content:** Use the `scrape_and_assess_news_impact` tool on that single URL. Its primary function for you is to scrape the full text of the article.
-    - **B) Extract and Format:** From the scraped content and the initial article data, meticulously extract the required information to populate the `NewsOutput` schema: `source`, `article_title`, `source_url`, `published_at`, and the full `scraped_content`.
-4.  **Output Structured Data:** Return the fully populated `NewsOutput` object. Your task for this cycle is now complete.
-
-**Rules & Constraints:**
-- **Mandatory Tool Sequence:** You MUST use the tools in this exact order: `extract_keywords` -> `get_news_articles` -> `scrape_and_assess_news_impact`.
-- **One Article Per Cycle:** You are designed to process and return data for only one article at a time. Your final output for a successful run is a single `NewsOutput` object.
-- **Focus on Extraction, Not Analysis:** Your job is to collect and structure data, not to analyze or assess market impact. Do not provide summaries, opinions, or any information not explicitly part of the `NewsOutput` schema.
-- **Data Integrity:** Ensure the `NewsOutput` object is populated accurately from the source data. The `scraped_content` field should contain the full text of the article you processed.
-"""
+You are a news collector for a quantitative analysis firm: retrieve recent articles relevant to a market event and return structured data, without interpretation.
 
-keywordTool = FunctionTool(
-    func = extract_keywords,
-    description = "Extracts keywords from the prompt that is then passed to the information sources to use as information."
-)
+Workflow, in this exact tool order:
+1. `extract_keywords` on the market topic.
+2. `get_news_articles` with those keywords.
+3. `scrape_and_assess_news_impact` on the most relevant article from the results.
 
-newsTool = FunctionTool(
-    func = get_news_articles,
-    description = "Searches for recent news articles related to a specific market question. Only use this tool to gather raw, unfiltered news articles."
-)
+Return one `NewsOutput` populated accurately from that article: `source`, `article_title`, `source_url`, `published_at`, and `scraped_content` holding the full article text.
 
-scrapeTool = FunctionTool(
-    func = scrape_and_assess_news_impact,
-    description = "Scrapes the full text from article URLs, then analyzes the article content to create a summary and assess the likely impact on a specific question about a Polymarket market. Use this AFTER fetching news articles with the get_news_articles tool."
-)
+You collect and structure, you do not analyze: no summaries, opinions, or fields outside the schema. One article per cycle; your reply is the `NewsOutput` object and nothing else.
+"""
+
+# FunctionTool takes only the callable; name and description are derived
+# from the function's docstring.
+newsTool = FunctionTool(func = get_news_articles)
+
+scrapeTool = FunctionTool(func = scrape_and_assess_news_impact)
 
 
 
 
+# No output_schema here: ADK refuses an agent that has both tools and a
+# schema, and the tools are the whole point. The instructions pin the reply
+# to the NewsOutput shape instead; validate downstream with
+# NewsOutput.model_validate_json if strictness is needed.
 NewsCollectorAgent = LlmAgent(
     name = "SocialMediaAnalyst",
     model = "gemini-1.5-flash",
     description = "Takes data from the observed events in the ticker and collects news articles related to the event.",
     instruction = NEWS_ANALYST_INSTRUCTIONS,
     tools = [keywordTool, newsTool, scrapeTool],
-    output_schema = NewsOutput
-    output_key = "news_output"
+    output_key = "news_output",
 )
 
 
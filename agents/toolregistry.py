@@ -0,0 +1,10 @@
+# Tools registered by more than one agent live here so each wraps a single
+# shared FunctionTool instance instead of building its own identical copy.
+
+from google.adk.tools import FunctionTool
+
+from tools.keyword import extract_keywords
+
+# FunctionTool takes only the callable; name and description are derived
+# from the function's docstring.
+keywordTool = FunctionTool(func = extract_keywords)
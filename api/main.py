@@ -1,18 +1,53 @@
-import sys
-import os
-from fastapi import FastAPI
+import time
 
+from fastapi import FastAPI, Response
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import ORJSONResponse
 
-from tools.newsanalysttools import get_news_articles
+from tools.newsanalysttools import _fetch_news_articles
+
+# ORJSONResponse serializes with orjson's native encoder, which is several
+# times faster than the stdlib json FastAPI defaults to -- the news payloads
+# are the largest thing this API returns.
+app = FastAPI(default_response_class=ORJSONResponse)
+
+NEWS_CACHE_TTL_SECONDS = 60
+
+# keywords -> (fetched_at, payload)
+_news_cache: dict[str, tuple[float, dict]] = {}
 
-app = FastAPI()
 
 @app.get("/news")
-async def get_news():
-    news_articles = get_news_articles()
-    return news_articles
+async def get_news(keywords: str, response: Response):
+    """Serves upstream news with a short TTL cache so request bursts collapse
+    to a single upstream fetch instead of one per hit."""
 
+    response.headers["Cache-Control"] = "s-maxage=30"
 
+    cached = _news_cache.get(keywords)
+    if cached is not None and time.time() - cached[0] < NEWS_CACHE_TTL_SECONDS:
+        return cached[1]
 
+    # Bypass the tool-layer lru_cache: it is permanent and nothing in an API
+    # worker ever resets it, so going through get_news_articles would pin the
+    # first-ever payload per keywords forever and make this TTL meaningless.
+    news_articles = await run_in_threadpool(_fetch_news_articles.__wrapped__, keywords)
+    _news_cache[keywords] = (time.time(), news_articles)
+    return news_articles
 
 
+if __name__ == "__main__":
+    import uvicorn
+
+    # uvloop and httptools replace asyncio's pure-Python event loop and HTTP
+    # parser with C implementations; multiple workers put one process per
+    # core behind the same port. Each worker keeps its own in-memory news
+    # cache, which is fine at a 60s TTL.
+    uvicorn.run(
+        "api.main:app",
+        host="0.0.0.0",
+        port=8000,
+        loop="uvloop",
+        http="httptools",
+        workers=4,
+    )
@@ -0,0 +1,12 @@
+# Shared connection-pool settings for the polymarket grabbers. The async
+# client in eventgrabber builds on these limits so one keep-alive pool is
+# reused across every page fetch instead of paying a fresh TLS handshake
+# per one-shot httpx.get when polling the gamma API repeatedly.
+
+import httpx
+
+LIMITS = httpx.Limits(
+    max_keepalive_connections=40,
+    max_connections=100,
+    keepalive_expiry=30,
+)
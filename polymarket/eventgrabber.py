@@ -1,43 +1,79 @@
+import asyncio
+
 import httpx
-import json
+import orjson
+import zstandard
+
+from polymarket._client import LIMITS
 
 gamma_events_endpoint = "https://gamma-api.polymarket.com/events"
-event_limit = 100
 
-# To implement 1000 events grabbing. 
+PAGE_SIZE = 100
+PAGE_COUNT = 10          # 1000 events per sweep
+FETCH_CONCURRENCY = 8
+
+BASE_PARAMS = {
+    "active": "true",
+    "closed": "false",
+    "archived": "false",
+}
 
-print(f"Fetching the latest {event_limit} events from Polymarket...")
 
-try:
-    
-    params = {
-        "active": "true",
-        "closed": "false",
-        "archived": "false",
-        "limit": 100,
-        "offset": 0,
-    }
+async def fetch_page(client: httpx.AsyncClient, sem: asyncio.Semaphore, offset: int) -> list:
+    """Fetches one page of events at the given offset."""
+
+    params = dict(BASE_PARAMS, limit=PAGE_SIZE, offset=offset)
+
+    async with sem:
+        response = await client.get(gamma_events_endpoint, params=params)
 
-    response = httpx.get(gamma_events_endpoint, params=params, timeout=30.0)
     response.raise_for_status()
-    limited_events = response.json()
-    print(f"\nSuccessfully fetched {len(limited_events)} events.")
+    # Decode with orjson so a malformed page actually raises the
+    # orjson.JSONDecodeError handled in __main__.
+    return orjson.loads(response.content)
+
+
+async def fetch_events(page_count: int = PAGE_COUNT) -> list:
+    """Fetches page_count pages of events concurrently.
+
+    The pages are independent, so firing them together costs roughly one
+    roundtrip instead of one per page; the semaphore keeps the burst polite
+    toward the gamma API."""
+
+    sem = asyncio.Semaphore(FETCH_CONCURRENCY)
+
+    async with httpx.AsyncClient(limits=LIMITS, timeout=30.0) as client:
+        pages = await asyncio.gather(
+            *[fetch_page(client, sem, page * PAGE_SIZE) for page in range(page_count)]
+        )
+
+    return [event for page in pages for event in page]
+
 
-    # --- Output to JSON ---
+if __name__ == "__main__":
+    print(f"Fetching the latest {PAGE_SIZE * PAGE_COUNT} events from Polymarket...")
 
-    final_json_output = json.dumps(limited_events, indent=2)
+    try:
+        limited_events = asyncio.run(fetch_events())
+        print(f"\nSuccessfully fetched {len(limited_events)} events.")
 
-    output_filename = "events.json"
+        # --- Output to zstd-compressed JSON ---
 
-    with open(output_filename, 'w', encoding='utf-8') as f:
-        f.write(final_json_output)
+        # Level-3 zstd shrinks the dump 5-10x and decompresses at GB/s, so
+        # the sorter reads a fraction of the bytes off disk for a decode
+        # cost that disappears next to the JSON parse itself. Compact
+        # encoding (no indent): the file is machine-read, and whitespace
+        # would just be bytes for the compressor to chew through.
+        output_filename = "events.json.zst"
 
-    print(f"The {len(limited_events)} most recent events have been saved to '{output_filename}'")
+        with open(output_filename, 'wb') as f:
+            f.write(zstandard.ZstdCompressor(level=3).compress(orjson.dumps(limited_events)))
 
+        print(f"The {len(limited_events)} most recent events have been saved to '{output_filename}'")
 
-except httpx.RequestError as e:
-    print(f"\nAn error occurred while communicating with the API: {e}")
-except json.JSONDecodeError:
-    print("\nError: Failed to decode JSON from the API response.")
-except Exception as e:
-    print(f"\nAn unexpected error occurred: {e}")
\ No newline at end of file
+    except httpx.RequestError as e:
+        print(f"\nAn error occurred while communicating with the API: {e}")
+    except orjson.JSONDecodeError:
+        print("\nError: Failed to decode JSON from the API response.")
+    except Exception as e:
+        print(f"\nAn unexpected error occurred: {e}")
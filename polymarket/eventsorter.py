@@ -1,10 +1,22 @@
-import json
+import argparse
+import functools
+import io
+import mmap
+import os
+import re
+
+import ijson
+import msgpack
+import orjson
+import zstandard
 import inquirer
 
-INPUT_FILENAME = 'events.json' 
+# eventgrabber now writes a zstd-compressed dump; fall back to the plain
+# file so older dumps still load.
+INPUT_FILENAME = 'events.json.zst' if os.path.exists('events.json.zst') else 'events.json'
 
-def get_user_choice() -> str:
-    """Gets label to sort for by user choice"""
+def get_user_choice() -> list[str]:
+    """Gets labels to sort for by user choice (any number of categories)."""
 
     category_choices = [
         "Politcs",
@@ -19,9 +31,9 @@ def get_user_choice() -> str:
     ]
 
     questions = [
-        inquirer.List(
+        inquirer.Checkbox(
             'selection',
-            message = "What category of events would you like to filter for?",
+            message = "What categories of events would you like to filter for? (space to toggle)",
             choices = category_choices,
             carousel = True,
         )
@@ -29,65 +41,122 @@ def get_user_choice() -> str:
 
     answers = inquirer.prompt(questions)
 
-    if answers:
-        print(f"\nYou selected {answers['selection']}.")
+    if answers and answers['selection']:
+        print(f"\nYou selected {', '.join(answers['selection'])}.")
         chosen_options = answers['selection']
         return chosen_options
     else:
         print("\nNo seleciton was made.")
         return None
-    
-if __name__ == "__main__":
-    TAG_LABEL_TO_FIND = get_user_choice()
 
 
-print(f"Attempting to load events from '{INPUT_FILENAME}'...")
+# Parsed once per path and shared across every filter pass in the session;
+# trying a different category combination no longer re-decodes the dump.
+@functools.lru_cache(maxsize=1)
+def _load_events(input_path: str) -> list[dict]:
+    """Parses the event dump and precomputes each event's tag-label set.
 
-try:
-    with open(INPUT_FILENAME, 'r', encoding='utf-8') as f:
-        all_events = json.load(f)
-    print(f"Successfully loaded {len(all_events)} events.")
+    The synthetic '_tag_labels' frozenset turns every later filter check
+    into a single set intersection instead of re-walking the tags list;
+    it is stripped again before anything is written to disk."""
 
-    print(f"Filtering for events with the label: '{TAG_LABEL_TO_FIND}'")
-    filtered_events = []
-    
-    for event in all_events:
-        if 'tags' in event and isinstance(event['tags'], list):
-            for tag_object in event['tags']:
-                if tag_object.get('label', '').lower() == TAG_LABEL_TO_FIND.lower():
-                    filtered_events.append(event)
-                    break 
+    events = []
 
-    if filtered_events:
-        print(f"\nSuccess! Found {len(filtered_events)} events matching the label.")
-        
-        output_filename = "filtered_by_label.json"
-        
-        final_json_output = json.dumps(filtered_events, indent=2)
+    # zstd dumps are decompressed in one shot (GB/s, a rounding error next
+    # to the parse); plain dumps are memory-mapped so the kernel pages bytes
+    # in on demand and nothing is copied into a Python string up front.
+    # Either way ijson then decodes event by event straight off the buffer.
+    if input_path.endswith('.zst'):
+        with open(input_path, 'rb') as f:
+            stream = io.BytesIO(zstandard.ZstdDecompressor().decompress(f.read()))
+    else:
+        with open(input_path, 'rb') as f:
+            stream = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+    # use_float keeps numbers as plain floats; ijson's default Decimal
+    # objects would blow up the orjson/msgpack writes downstream.
+    for event in ijson.items(stream, 'item', use_float=True):
+        tags = event.get('tags')
+        event['_tag_labels'] = frozenset(
+            (tag_object.get('label') or '').casefold()
+            for tag_object in (tags if isinstance(tags, list) else ())
+        )
+        events.append(event)
+    stream.close()
+
+    print(f"Scanned {len(events)} events.")
+    return events
+
+
+def _strip_synthetic_keys(event: dict) -> dict:
+    return {k: v for k, v in event.items() if not k.startswith('_')}
+
+
+# Labels arrive as a tuple so the memoization key is hashable. The parse
+# itself is cached once per path in _load_events, so a new category
+# combination only pays the set-intersection scan; repeating one (the
+# common back-and-forth in the selector) pays nothing at all.
+@functools.lru_cache(maxsize=8)
+def filter_events(input_path: str, labels: tuple[str, ...]) -> list[dict]:
+    """Keeps events tagged with any of the labels."""
+
+    # Casefolded once here; an event matches if any of its tag labels is in
+    # the selected set, so the per-event check is one set intersection
+    # against the precomputed '_tag_labels' no matter how many categories
+    # were picked.
+    targets = frozenset(label.casefold() for label in labels)
+
+    # Cheap prefilter straight on the file bytes: if none of the labels
+    # appear anywhere, no event can possibly match and the parse is skipped
+    # entirely. The scan is case-insensitive (re searches the mapping
+    # without copying it) so it can only ever be a conservative skip --
+    # probing fixed case variants could miss e.g. an all-caps label and
+    # wrongly return nothing. Compressed dumps skip the probe; it would
+    # cost a full decompression, which is the bulk of the load anyway.
+    if not input_path.endswith('.zst'):
+        with open(input_path, 'rb') as f:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+            def _label_in_dump(label: str) -> bool:
+                return re.search(re.escape(label).encode(), mm, re.IGNORECASE) is not None
+
+            found_any = any(_label_in_dump(label) for label in labels)
+            mm.close()
+
+        if not found_any:
+            print(f"No occurrence of {list(labels)} anywhere in the dump; skipping parse.")
+            return []
+
+    return [
+        event for event in _load_events(input_path)
+        if targets & event['_tag_labels']
+    ]
 
-        with open(output_filename, 'w', encoding='utf-8') as f:
-            f.write(final_json_output)
 
-        print(f"Filtered events have been saved to '{output_filename}'")
+def save_filtered_events(filtered_events: list[dict], fmt: str = "json"):
+    """Writes the filtered events out for the downstream selectors.
+
+    msgpack is for machine-to-machine handoff: the pretty-printed JSON is
+    mostly whitespace and has to be re-parsed by every downstream tool,
+    while the packed form is a fraction of the size and decodes faster."""
+
+    clean_events = [_strip_synthetic_keys(event) for event in filtered_events]
+
+    if fmt == "msgpack":
+        output_filename = "filtered_by_label.msgpack"
+        with open(output_filename, 'wb') as f:
+            f.write(msgpack.packb(clean_events, use_bin_type=True))
     else:
-        print(f"\nNo events were found with the label '{TAG_LABEL_TO_FIND}'.")
-        
+        output_filename = "filtered_by_label.json"
+        with open(output_filename, 'wb') as f:
+            f.write(orjson.dumps(clean_events, option=orjson.OPT_INDENT_2))
 
-except FileNotFoundError:
-    print(f"\n[ERROR] The file '{INPUT_FILENAME}' was not found.")
-    print("Please make sure the JSON file is in the same folder as this script and the filename is correct.")
-except json.JSONDecodeError:
-    print(f"\n[ERROR] The file '{INPUT_FILENAME}' is not a valid JSON file.")
-except Exception as e:
-    print(f"\nAn unexpected error occurred: {e}")
+    print(f"Filtered events have been saved to '{output_filename}'")
 
 
-def select_event(filename = "filtered_by_label.json"):
+def select_event(filtered_events: list[dict]) -> dict:
     """Takes in a list of events and allows the user to select which even to specifically examine."""
 
-    with open(filename, 'r', encoding = "utf-8") as f:
-        filtered_events = json.load(f)
-
     questions =[
         inquirer.List(
             'selection',
@@ -102,26 +171,19 @@ def select_event(filename = "filtered_by_label.json"):
     if answers:
         print(f"\nYou selected {answers['selection']}.")
 
-        for event in all_events:
-            if event['title'] == answers['selection']:
-                selected_event = event
-                break
+        by_title = {event['title']: event for event in filtered_events}
+        selected_event = by_title[answers['selection']]
 
         filename = "selected_event.json"
-        with open(filename, 'w', encoding = 'utf-8') as f:
-            json.dump(selected_event, f, indent=2)
-        return None
+        with open(filename, 'wb') as f:
+            f.write(orjson.dumps(_strip_synthetic_keys(selected_event), option=orjson.OPT_INDENT_2))
+        return selected_event
     else:
         print("\nNo seleciton was made.")
         return None
 
-select_event()
-
-def select_market(filename = "selected_event.json"):
-    """Takes in a list of events and allows the user to select which even to specifically examine."""
-
-    with open(filename, 'r', encoding = "utf-8") as f:
-        selected_event = json.load(f)
+def select_market(selected_event: dict) -> dict:
+    """Takes in a selected event and allows the user to select which market to specifically examine."""
 
     questions =[
         inquirer.List(
@@ -137,17 +199,58 @@ def select_market(filename = "selected_event.json"):
     if answers:
         print(f"\nYou selected {answers['selection']}.")
 
-        for market in selected_event['markets']:
-            if market['question'] == answers['selection']:
-                selected_market = market
-                break
+        by_question = {market['question']: market for market in selected_event['markets']}
+        selected_market = by_question[answers['selection']]
 
         filename = "selected_market.json"
-        with open(filename, 'w', encoding = 'utf-8') as f:
-            json.dump(selected_market, f, indent=2)
-        return None
+        with open(filename, 'wb') as f:
+            f.write(orjson.dumps(selected_market, option=orjson.OPT_INDENT_2))
+        return selected_market
     else:
         print("\nNo seleciton was made.")
         return None
 
-select_market()
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Filter the event dump by category tags.")
+    parser.add_argument(
+        "--format",
+        choices=["json", "msgpack"],
+        default="json",
+        help="output format for the filtered events (msgpack is smaller and faster to re-parse)",
+    )
+    args = parser.parse_args()
+
+    tag_labels_to_find = get_user_choice()
+
+    if not tag_labels_to_find:
+        raise SystemExit(0)
+
+    print(f"Attempting to load events from '{INPUT_FILENAME}'...")
+
+    try:
+        print(f"Filtering for events with the labels: {tag_labels_to_find}")
+        filtered_events = filter_events(INPUT_FILENAME, tuple(tag_labels_to_find))
+
+        if filtered_events:
+            print(f"\nSuccess! Found {len(filtered_events)} events matching the labels.")
+            save_filtered_events(filtered_events, fmt=args.format)
+        else:
+            print(f"\nNo events were found with the labels {tag_labels_to_find}.")
+            raise SystemExit(0)
+
+    except FileNotFoundError:
+        print(f"\n[ERROR] The file '{INPUT_FILENAME}' was not found.")
+        print("Please make sure the JSON file is in the same folder as this script and the filename is correct.")
+        raise SystemExit(1)
+    except ijson.JSONError:
+        print(f"\n[ERROR] The file '{INPUT_FILENAME}' is not a valid JSON file.")
+        raise SystemExit(1)
+    except Exception as e:
+        print(f"\nAn unexpected error occurred: {e}")
+        raise SystemExit(1)
+
+    selected_event = select_event(filtered_events)
+
+    if selected_event:
+        select_market(selected_event)
@@ -1,18 +1,38 @@
-import requests
+import asyncio
+import functools
+
+import httpx
 from dotenv import load_dotenv
 import os
 import json
 from bs4 import BeautifulSoup
 from datetime import datetime
 
+from tools.httpclient import get_async_client, shared_client
+from tools.scrapecache import get_cached_page, store_page
+
+SCRAPE_CONCURRENCY = 8
+
+SCRAPE_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36",
+    # brotli is installed, so httpx can decode 'br' -- ~20% smaller than
+    # gzip on HTML, and scraping is bandwidth-bound.
+    "Accept-Encoding": "br, gzip, deflate",
+}
+
 #TO BE UPDATED AND FIXED
 
 load_dotenv()
 
-#want the ai model to craft a question based on the thing to pass to the json. 
-with open("selected_market.json", 'r', encoding = 'utf-8') as f:
-    selected_market = json.load(f)
+#want the ai model to craft a question based on the thing to pass to the json.
+# Loaded lazily so importing the module never touches disk; the parse is
+# paid once per market (the per-market reset in the orchestrator clears it).
+@functools.lru_cache(maxsize=1)
+def _load_selected_market() -> dict:
+    with open("selected_market.json", 'r', encoding='utf-8') as f:
+        return json.load(f)
 
+@functools.lru_cache(maxsize=256)
 def search_expert_sources(keywords: str) -> list[dict]:
     """
     Searches the web for information related to a specific query.
@@ -38,21 +58,19 @@ def search_expert_sources(keywords: str) -> list[dict]:
         "key": api_key,
         "cx": search_engine_id,
         "q": keywords,
-        "dateRestrict": selected_market['startDate'],
+        "dateRestrict": _load_selected_market()['startDate'],
         "num": 5,
         "sort": "date"
     }
 
-    response = requests.get(url, params=params)
+    response = shared_client.get(url, params=params)
     response.raise_for_status()
     data = response.json()
 
     with(open("expert_sources.json", 'w') as outfile):
         json.dump(data, outfile, indent=2, sort_keys=False)
 
-    return data 
-
-search_expert_sources("Pacers NBA 2025")
+    return data
 
 
 def scrape_url(url: str) -> str:
@@ -65,25 +83,81 @@ def scrape_url(url: str) -> str:
     Returns:
         str: The extracted text content, or an error message string if scraping fails.
     """
+    cached = get_cached_page(url)
+    if cached is not None:
+        print(f"  > Serving cached copy of: {url}")
+        return cached['body']
+
     print(f"  > Scraping URL: {url}")
-    headers = {
-        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
-    }
-    
+
+    try:
+        response = shared_client.get(url, headers=SCRAPE_HEADERS, timeout=15)
+        response.raise_for_status()
+        soup = BeautifulSoup(response.content, 'lxml')
+
+        for script_or_style in soup(["script", "style"]):
+            script_or_style.decompose()
+
+        text = soup.get_text(separator=' ', strip=True)
+        store_page(url, text)
+        return text
+    except httpx.HTTPError as e:
+        error_message = f"Failed to scrape URL {url}: {e}"
+        print(f"  > {error_message}")
+        store_page(url, error_message, ok=False)
+        return error_message
+
+async def _scrape_one(client: httpx.AsyncClient, sem: asyncio.Semaphore, url: str) -> str:
+    """Scrapes a single URL through the disk cache, bounded by the semaphore."""
+
+    cached = get_cached_page(url)
+    if cached is not None:
+        print(f"  > Serving cached copy of: {url}")
+        return cached['body']
+
+    print(f"  > Scraping URL: {url}")
+
     try:
-        response = requests.get(url, headers=headers, timeout=15)
+        async with sem:
+            response = await client.get(url, headers=SCRAPE_HEADERS, timeout=15)
         response.raise_for_status()
-        soup = BeautifulSoup(response.content, 'html.parser')
-        
+        soup = BeautifulSoup(response.content, 'lxml')
+
         for script_or_style in soup(["script", "style"]):
             script_or_style.decompose()
 
-        return soup.get_text(separator=' ', strip=True)
-    except requests.exceptions.RequestException as e:
+        text = soup.get_text(separator=' ', strip=True)
+        store_page(url, text)
+        return text
+    except httpx.HTTPError as e:
         error_message = f"Failed to scrape URL {url}: {e}"
         print(f"  > {error_message}")
+        store_page(url, error_message, ok=False)
         return error_message
 
+
+async def scrape_urls(urls: list[str]) -> list[str]:
+    """
+    Scrapes all visible text from a list of URLs concurrently.
+
+    The fetches are I/O-bound, so firing them together costs roughly one
+    max-latency roundtrip instead of one per URL. Concurrency is capped at
+    SCRAPE_CONCURRENCY so target sites are not hammered.
+
+    Args:
+        urls (list[str]): The URLs of the web pages to scrape.
+
+    Returns:
+        list[str]: The extracted text per URL, in input order. Failures
+        yield an error message string in that slot.
+    """
+
+    sem = asyncio.Semaphore(SCRAPE_CONCURRENCY)
+    client = get_async_client()
+
+    return list(await asyncio.gather(*[_scrape_one(client, sem, url) for url in urls]))
+
+
 def process_and_save_scraped_data(search_results: dict):
     """
     Processes the search results dictionary, scrapes each link, and saves the final data.
@@ -93,17 +167,16 @@ def process_and_save_scraped_data(search_results: dict):
         print("Error: Invalid search result data provided. Cannot find 'items'.")
         return
 
-    all_scraped_articles = []
-    for item in search_results['items']:
-        link = item.get('link')
-        if not link:
-            continue
+    links = [item.get('link') for item in search_results['items'] if item.get('link')]
+    scraped_texts = asyncio.run(scrape_urls(links))
 
-        scraped_text = scrape_url(link)
-        
+    all_scraped_articles = []
+    for item, scraped_text in zip(
+        (item for item in search_results['items'] if item.get('link')), scraped_texts
+    ):
         article_data = {
             "title": item.get('title'),
-            "url": link,
+            "url": item.get('link'),
             "source_snippet": item.get('snippet'),
             "scraped_content": scraped_text
         }
@@ -126,10 +199,6 @@ def process_and_save_scraped_data(search_results: dict):
 
 if __name__ == "__main__":
 
-    with open("selected_market.json", 'r', encoding = 'utf-8') as f:
-        selected_market = json.load(f)
-
-
     search_results_data = search_expert_sources("Pacers NBA 2025")
 
     if search_results_data:
@@ -0,0 +1,34 @@
+# Pooled HTTP clients shared by every fetch path. TCP+TLS connections are
+# kept alive and reused across scrape batches instead of being
+# re-established per call, and the pool caps total connections toward
+# remote hosts.
+
+import asyncio
+import weakref
+
+import httpx
+
+LIMITS = httpx.Limits(max_connections=20, max_keepalive_connections=20)
+
+# AsyncClient connections are bound to the event loop they were opened on,
+# and the tools get driven through separate asyncio.run() calls (one per
+# market / per CLI run). A single module-level client would reuse keep-alive
+# sockets from a closed loop and die with "Event loop is closed" on the
+# second run, so each running loop gets its own client, dropped with the
+# loop itself.
+_async_clients = weakref.WeakKeyDictionary()
+
+
+def get_async_client() -> httpx.AsyncClient:
+    """Returns the pooled client for the current running event loop."""
+
+    loop = asyncio.get_running_loop()
+    client = _async_clients.get(loop)
+    if client is None or client.is_closed:
+        client = httpx.AsyncClient(follow_redirects=True, limits=LIMITS)
+        _async_clients[loop] = client
+    return client
+
+# Sync twin for the tools that still run blocking fetches (search/news API
+# lookups, the single-URL scrape). Same pool semantics as the async client.
+shared_client = httpx.Client(follow_redirects=True, limits=LIMITS, timeout=30.0)
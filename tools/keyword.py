@@ -1,25 +1,50 @@
-# Extracts keywords from the prompt that is then passed to the information sources to use as information. 
+# Extracts keywords from the prompt that is then passed to the information sources to use as information.
+
+import functools
 
 import spacy
 import json
 
-nlp = spacy.load("en_core_web_sm")
+# Keyword extraction only reads token.pos_ and token.lemma_, so the parser
+# and NER components -- the two most expensive stages of the pipeline -- are
+# dead weight here and are never loaded.
+nlp = spacy.load("en_core_web_sm", disable=["parser", "ner"])
 
-def extract_keywords(market: json = "selected_market.json"): 
+KEYWORD_POS = {"PROPN", "NOUN", "ADJ"}
 
-    with open(market, "r", encoding = "utf-8") as f:
-        selected_market = json.load(f)
 
-    question = nlp(selected_market["question"])
+def _keywords_from_doc(doc) -> str:
+    return " ".join(token.lemma_ for token in doc if token.pos_ in KEYWORD_POS)
 
-    keywords = [token.lemma_ for token in question if token.pos_ in ['PROPN', 'NOUN', 'ADJ']]
 
-    final = ""
+@functools.lru_cache(maxsize=256)
+def extract_keywords(market: json = "selected_market.json"):
+    """Extracts keywords from the prompt that is then passed to the information sources to use as information."""
 
-    for key in keywords: 
-        final += key + " " 
+    with open(market, "r", encoding = "utf-8") as f:
+        selected_market = json.load(f)
 
+    final = _keywords_from_doc(nlp(selected_market["question"]))
     print(final)
 
+    # The analyst prompts mandate a fetch tool as the next call with exactly
+    # these keywords; start the news lookup now so the API roundtrip runs
+    # while the LLM is still decoding its next turn. Imported lazily to keep
+    # keyword extraction usable without the news tool's module-level setup.
+    from tools.newsanalysttools import prefetch_news_articles
+    prefetch_news_articles(final)
+
+    return final
+
+
+def extract_keywords_batch(questions: list[str]) -> list[str]:
+    """Extracts keywords for many questions in one pipeline pass.
 
+    nlp.pipe batches the documents through spaCy internally, amortizing the
+    per-doc pipeline overhead; sweep-style callers should use this instead
+    of invoking extract_keywords once per market."""
 
+    return [
+        _keywords_from_doc(doc)
+        for doc in nlp.pipe(questions, batch_size=32)
+    ]
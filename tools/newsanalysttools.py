@@ -1,64 +1,208 @@
-import requests
+import asyncio
+import functools
+from concurrent.futures import ProcessPoolExecutor
+
+import httpx
+import orjson
 from dotenv import load_dotenv
 import os
 import json
 from bs4 import BeautifulSoup
 import re
 
-load_dotenv()
+from tools import prefetch
+from tools.httpclient import get_async_client, shared_client
+from tools.scrapecache import get_cached_page, store_page
+
+SCRAPE_CONCURRENCY = 8
+
+# Only ~1000 chars of each article survive into the prompt, so downloading
+# a whole multi-MB page is wasted bandwidth and parse CPU. Pages declaring
+# more than MAX_PAGE_BYTES are skipped outright; otherwise the body is read
+# in chunks and cut off at BODY_CAP_BYTES.
+MAX_PAGE_BYTES = 2_000_000
+BODY_CAP_BYTES = 262_144
+
+# Compiled once; the pattern runs over multi-KB article bodies in the hot
+# loop, so skip the re-module cache lookup per call.
+_WS_RE = re.compile(r"\s+")
+
+SCRAPE_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36",
+    # brotli is installed, so httpx can decode 'br' -- ~20% smaller than
+    # gzip on HTML, and scraping is bandwidth-bound.
+    "Accept-Encoding": "br, gzip, deflate",
+}
+
+# HTML parsing is the CPU-bound half of the scrape; pushing it into worker
+# processes sidesteps the GIL so a large article batch parses on all cores.
+# Created on first use -- spawning workers at import would undo the lazy-
+# import work above (the module is now side-effect-free to import, which is
+# also what makes it safe for the workers themselves to import).
+_parse_pool = None
+
+
+def _get_parse_pool() -> ProcessPoolExecutor:
+    global _parse_pool
+    if _parse_pool is None:
+        _parse_pool = ProcessPoolExecutor(max_workers=os.cpu_count())
+    return _parse_pool
+
+
+def _extract_article_text(page_content: bytes) -> str:
+    """Parses one article page down to whitespace-collapsed paragraph text.
+
+    Runs in the parse-pool workers: takes bytes, returns a plain str, and
+    touches no module state beyond the compiled regex."""
+
+    soup = BeautifulSoup(page_content, "lxml")
+
+    # One selector walk scoped to the article/main body; falls back to
+    # every <p> on pages without semantic containers.
+    paragraphs = soup.select('article p, main p') or soup.find_all('p')
+
+    full_text = " ".join(p.get_text() for p in paragraphs)
+    return _WS_RE.sub(' ', full_text).strip()
+
+
+async def _fetch_article_pages(urls: list[str]) -> dict:
+    """Fetches every article URL concurrently; returns {url: body bytes or None}.
+
+    The fetches are pure I/O, so gathering them costs one max-latency
+    roundtrip instead of one per article. Concurrency is capped at
+    SCRAPE_CONCURRENCY so news sites are not hammered."""
+
+    sem = asyncio.Semaphore(SCRAPE_CONCURRENCY)
+
+    async def fetch(client, url):
+        try:
+            async with sem:
+                async with client.stream("GET", url, headers=SCRAPE_HEADERS, timeout=10) as page_response:
+                    page_response.raise_for_status()
+
+                    # Some feeds link straight to PDFs or video; the parser
+                    # can't use them, so bail on the headers before paying
+                    # for the body.
+                    content_type = page_response.headers.get("Content-Type", "")
+                    if content_type and "html" not in content_type:
+                        print(f"  > Skipping non-HTML content ({content_type}): {url}")
+                        return url, None
+
+                    declared = int(page_response.headers.get("Content-Length", "0"))
+                    if declared > MAX_PAGE_BYTES:
+                        print(f"  > Skipping oversized page ({declared} bytes): {url}")
+                        return url, None
+
+                    buf = bytearray()
+                    async for chunk in page_response.aiter_bytes(16384):
+                        buf.extend(chunk)
+                        if len(buf) >= BODY_CAP_BYTES:
+                            break
+            return url, bytes(buf)
+        except httpx.HTTPError as e:
+            print(f"  > Failed to fetch URL {url}: {e}")
+            return url, None
+
+    client = get_async_client()
+    results = await asyncio.gather(*[fetch(client, url) for url in urls])
+
+    return dict(results)
 
 INPUT_FILENAME = "selected_market.json"
 
-NEWS_API_KEY = os.getenv("NEWS_API_KEY")
 
-with open (INPUT_FILENAME, 'r', encoding = 'utf-8') as f:
-    selected_market = json.load(f)
+# .env is read on first use rather than at import, so merely importing the
+# module touches neither the filesystem nor the environment.
+@functools.lru_cache(maxsize=1)
+def _news_api_key() -> str:
+    load_dotenv()
+    return os.getenv("NEWS_API_KEY")
 
 
-# Might have to use paignation. 
+# Loaded lazily so importing the module never touches disk; the parse is
+# paid once per market (the per-market reset in the orchestrator clears it).
+@functools.lru_cache(maxsize=1)
+def _load_selected_market() -> dict:
+    with open(INPUT_FILENAME, 'r', encoding='utf-8') as f:
+        return json.load(f)
 
-def get_news_articles(keywords: str):
-    """
-    Searches for recent news articles related to a specific market question.
-    Only use this tool to gather raw, unfiltered news articles.
-    """
 
+# Might have to use paignation.
+
+@functools.lru_cache(maxsize=256)
+def _fetch_news_articles(keywords: str):
     print(f"Tool 'fetch_news_for_market' called with question: '{keywords}'")
 
     news_api_url = "https://api.thenewsapi.com/v1/news/top"
 
-    date = selected_market['startDate'].split(".")[0]
+    date = _load_selected_market()['startDate'].split(".")[0]
 
     params = {
         "search": keywords,
         "published_after": date,
-        "api_token": NEWS_API_KEY,
+        "api_token": _news_api_key(),
         "language": "en",
         "sort": "relevance_score",
         "limit": 3,
     }
     
     try:
-        response = requests.get(news_api_url, params=params)
+        response = shared_client.get(news_api_url, params=params)
         response.raise_for_status()
+        # orjson decodes the raw bytes once (the old path parsed the
+        # response twice via response.json()) and serializes in C.
+        payload = orjson.loads(response.content)
+        # news_articles.json is a machine-read intermediate, so it is
+        # written compact; set PRETTY_JSON=1 to get an indented copy for
+        # eyeballing.
         filename = "news_articles.json"
-        with open(filename, 'w') as outfile:
-            json.dump(response.json(), outfile, indent=2, sort_keys=False)
-        return response.json()
+        with open(filename, 'wb') as outfile:
+            option = orjson.OPT_INDENT_2 if os.getenv("PRETTY_JSON") else 0
+            outfile.write(orjson.dumps(payload, option=option))
+        return payload
     
-    except requests.exceptions.HTTPError as http_err:
+    except httpx.HTTPStatusError as http_err:
         return {
             "error": "HTTP error occurred",
             "details": str(http_err),
             "response_text": response.text  
         }
     
-    except requests.exceptions.RequestException as req_e:
+    except httpx.HTTPError as req_e:
         return {"error": "A request error occurred", "details": str(req_e)}
     except Exception as e:
         return {"error": "An unknown error occurred", "details": str(e)}
 
-def scrape_and_assess_news_impact(news_articles_json, market_question):
+
+def get_news_articles(keywords: str):
+    """
+    Searches for recent news articles related to a specific market question.
+    Only use this tool to gather raw, unfiltered news articles.
+    """
+
+    pending = prefetch.take(("news", keywords))
+    if pending is not None:
+        print(f"Awaiting prefetched news for: '{keywords}'")
+        return pending.result()
+
+    return _fetch_news_articles(keywords)
+
+
+# The memoization lives on the inner fetch; keep cache_clear reachable from
+# the public name so the per-request reset in the orchestrator still works.
+get_news_articles.cache_clear = _fetch_news_articles.cache_clear
+
+
+def prefetch_news_articles(keywords: str) -> None:
+    """Kicks off the news lookup in the background.
+
+    Called by extract_keywords the moment keywords are known: the analyst
+    prompts mandate get_news_articles as the next tool call, so the API
+    roundtrip hides behind the LLM's decoding time instead of adding to it."""
+
+    prefetch.start(("news", keywords), _fetch_news_articles, keywords)
+
+async def scrape_and_assess_news_impact(news_articles_json, market_question):
     """
     Scrapes the full text from article URLs, then analyzes the article content to create a summary
     and assess the likely impact on a specific question about a Polymarket market.
@@ -76,52 +220,82 @@ def scrape_and_assess_news_impact(news_articles_json, market_question):
     article_data = news_articles_json['data']
     if not article_data:
         return "No articles found in the provided JSON. Cannot perform analysis."
-    
-    context_block = ""
+
+    uncached_urls = [
+        article["url"] for article in article_data
+        if article.get("url") and get_cached_page(article["url"]) is None
+    ]
+    prefetched = await _fetch_article_pages(uncached_urls)
+
+    # Fan the fetched bodies out to the parse pool while the event loop
+    # stays free; results (or the worker's exception) come back per URL.
+    loop = asyncio.get_running_loop()
+    parse_jobs = {
+        url: loop.run_in_executor(_get_parse_pool(), _extract_article_text, body)
+        for url, body in prefetched.items()
+        if body is not None
+    }
+    parsed = dict(zip(
+        parse_jobs,
+        await asyncio.gather(*parse_jobs.values(), return_exceptions=True),
+    ))
+
+    # Fragments are collected and joined once at the end; repeated += on a
+    # growing string reallocates the whole block every iteration.
+    context_parts = []
 
     for i, article in enumerate(article_data):
         url = article["url"]
         if not url:
             continue
-        
-        print(f"Scraping URL: {url}")
 
-        try: 
-            headers = {
-                "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
-            }
-            page_response = requests.get(url, headers=headers, timeout=10)
-            page_response.raise_for_status()
-
-            soup = BeautifulSoup(page_response.content, "html.parser")
-
-            article_body = soup.find('article') or soup.find('main')
+        cached = get_cached_page(url)
+        if cached is not None and not cached['ok']:
+            print(f"  > Skipping recently failed URL: {url}")
+            context_parts.append(
+                f"Article {i+1} (Source: {article.get('source')}, SCRAPE FAILED):\n"
+                f"Title: {article.get('title')}\n"
+                f"Snippet: {article.get('snippet')}\n---\n"
+            )
+            continue
 
-            if article_body:
-                paragraphs = article.body.find_all('p')
-            
+        try:
+            if cached is not None:
+                print(f"Serving cached copy of URL: {url}")
+                cleaned_text = cached['body']
             else:
-                paragraphs = soup.find_all('p')
+                result = parsed.get(url)
+                if result is None:
+                    raise httpx.RequestError(f"fetch failed for {url}")
+                if isinstance(result, Exception):
+                    raise result
 
-            full_text = " ".join([p.get_text() for p in paragraphs])
+                cleaned_text = result
 
-            cleaned_text = re.sub(r'\s+', ' ', full_text).strip()
+                store_page(url, cleaned_text)
 
-        # Code below can be improved. 
-            context_block += f"Article {i+1} (Source: {article.get('source')}):\n"
-            context_block += f"Title: {article.get('title')}\n"
-            context_block += f"Full Text Summary: {cleaned_text[:1000]}...\n---\n" # TO avoid huge prompts
+        # Code below can be improved.
+            context_parts.append(
+                f"Article {i+1} (Source: {article.get('source')}):\n"
+                f"Title: {article.get('title')}\n"
+                f"Full Text Summary: {cleaned_text[:1000]}...\n---\n"  # TO avoid huge prompts
+            )
 
         except Exception as e:
             print(f"  > Failed to scrape or parse URL {url}: {e}")
+            store_page(url, "", ok=False)
             # Add the snippet as a fallback if scraping fails
-            context_block += f"Article {i+1} (Source: {article.get('source')}, SCRAPE FAILED):\n"
-            context_block += f"Title: {article.get('title')}\n"
-            context_block += f"Snippet: {article.get('snippet')}\n---\n"
+            context_parts.append(
+                f"Article {i+1} (Source: {article.get('source')}, SCRAPE FAILED):\n"
+                f"Title: {article.get('title')}\n"
+                f"Snippet: {article.get('snippet')}\n---\n"
+            )
 
-    if not context_block:
+    if not context_parts:
         return "Could not extract content from any of the provided article URLs."
-    
+
+    context_block = "".join(context_parts)
+
     return f"""
     **Analysis of Scraped News Content:**
 
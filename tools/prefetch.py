@@ -0,0 +1,44 @@
+# Speculative prefetch for the fixed tool chain. The analyst prompts pin the
+# tool order (extract_keywords -> fetch -> scrape), so the next fetch can be
+# started in the background the moment its input is known -- by the time the
+# LLM finishes decoding the turn that asks for it, the result is already in
+# flight and the tool just awaits it.
+
+from concurrent.futures import ThreadPoolExecutor, wait
+
+_executor = ThreadPoolExecutor(max_workers=4)
+
+# key -> Future for a fetch that was started speculatively
+_in_flight = {}
+
+
+def start(key, func, *args) -> None:
+    """Starts func(*args) in the background unless one is already pending for key."""
+
+    if key not in _in_flight:
+        _in_flight[key] = _executor.submit(func, *args)
+
+
+def take(key):
+    """Returns and removes the pending future for key, or None if nothing was prefetched."""
+
+    return _in_flight.pop(key, None)
+
+
+def clear() -> None:
+    """Cancels and forgets every speculative fetch still in flight.
+
+    Called from the per-market cache reset: a future keyed on keywords the
+    model never asked for would otherwise leak, and one keyed on keywords a
+    later market reuses would serve data fetched under the previous
+    market's parameters.
+
+    Futures already executing cannot be cancelled, so those are waited out:
+    their results land in the tool lru_caches on completion, and the reset
+    clears those caches *after* this call -- blocking here guarantees no
+    stale insert slips in behind the wipe."""
+
+    running = [f for f in _in_flight.values() if not f.cancel()]
+    if running:
+        wait(running)
+    _in_flight.clear()
@@ -0,0 +1,59 @@
+# On-disk cache for scraped pages. Across a full event sweep the analysts
+# keep landing on the same expert and news URLs, so repeat scrapes are
+# served from disk instead of re-fetching the page.
+
+import hashlib
+import json
+import os
+import time
+from typing import Optional
+
+CACHE_DIR = ".scrape_cache"
+CACHE_TTL_SECONDS = 86400
+NEGATIVE_TTL_SECONDS = 60
+
+
+def _cache_path(url: str) -> str:
+    digest = hashlib.sha256(url.encode('utf-8')).hexdigest()
+    return os.path.join(CACHE_DIR, digest + ".json")
+
+
+def get_cached_page(url: str) -> Optional[dict]:
+    """Returns the cached entry for a URL, or None on a miss.
+
+    Entries are dicts with 'ok' (whether the scrape succeeded) and 'body'.
+    Failed scrapes only live for NEGATIVE_TTL_SECONDS so a transient error
+    does not poison a whole day of runs, but bursts of retries are still
+    absorbed."""
+
+    path = _cache_path(url)
+
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            entry = json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return None
+
+    ttl = CACHE_TTL_SECONDS if entry.get('ok') else NEGATIVE_TTL_SECONDS
+    if time.time() - entry.get('time', 0) > ttl:
+        return None
+
+    return entry
+
+
+def store_page(url: str, body: str, ok: bool = True) -> None:
+    """Stores a scraped body (or a failure marker) for later runs."""
+
+    os.makedirs(CACHE_DIR, exist_ok=True)
+
+    entry = {
+        "time": time.time(),
+        "ok": ok,
+        "body": body,
+    }
+
+    try:
+        with open(_cache_path(url), 'w', encoding='utf-8') as f:
+            json.dump(entry, f)
+    except IOError as e:
+        print(f"  > Could not write scrape cache for {url}: {e}")
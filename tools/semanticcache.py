@@ -0,0 +1,58 @@
+# Semantic cache for full analyst outputs. Many markets are near-duplicates
+# ("Will X exceed Y by date Z?") varying only in a number or date, and
+# re-running the whole expert+news pipeline on each one wastes LLM and
+# scrape spend. Questions are reduced to normalized token sets and compared
+# with Jaccard similarity; at a few hundred markets per sweep a linear scan
+# is plenty and avoids shipping an embedding model + vector index.
+
+import re
+import time
+from typing import Optional
+
+SIMILARITY_THRESHOLD = 0.9
+
+# Entries expire after 6h so fresh news eventually invalidates old analysis.
+CACHE_TTL_SECONDS = 6 * 3600
+
+_WORD_RE = re.compile(r"[a-z0-9]+")
+
+# list of (token frozenset, stored_at, output)
+_entries = []
+
+
+def _tokens(question: str) -> frozenset:
+    return frozenset(_WORD_RE.findall(question.lower()))
+
+
+def _similarity(a: frozenset, b: frozenset) -> float:
+    if not a or not b:
+        return 0.0
+    return len(a & b) / len(a | b)
+
+
+def lookup(question: str) -> Optional[str]:
+    """Returns the cached output for a sufficiently similar question, or None."""
+
+    now = time.time()
+    tokens = _tokens(question)
+
+    best_output = None
+    best_score = SIMILARITY_THRESHOLD
+
+    for cached_tokens, stored_at, output in _entries:
+        if now - stored_at > CACHE_TTL_SECONDS:
+            continue
+        score = _similarity(tokens, cached_tokens)
+        if score >= best_score:
+            best_score = score
+            best_output = output
+
+    return best_output
+
+
+def store(question: str, output: str) -> None:
+    """Caches the analyst output for a question, dropping expired entries."""
+
+    now = time.time()
+    _entries[:] = [e for e in _entries if now - e[1] <= CACHE_TTL_SECONDS]
+    _entries.append((_tokens(question), now, output))